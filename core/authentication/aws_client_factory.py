@@ -1,21 +1,70 @@
 # mypy: disable-error-code="valid-type, name-defined"
 from __future__ import annotations
 
+import functools
 import os
-import re
 import typing
-from typing import TYPE_CHECKING, Optional, Protocol, Type
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Optional, Protocol, Type
 
 import boto3
+import botocore.loaders
+import botocore.session
 from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.credentials import (CredentialProvider, CredentialResolver,
+                                  RefreshableCredentials)
 
 from mypy_boto3.literals import ServiceName
+from mypy_boto3_identitystore import IdentityStoreClient
+from mypy_boto3_servicecatalog import ServiceCatalogClient
+from mypy_boto3_sso_admin import SSOAdminClient
+from mypy_boto3_sts import STSClient
 from mypy_boto3_sts.type_defs import CredentialsTypeDef
 
 
 # used to extract client name from a mypy_boto3 module name
-ClientNamePattern = re.compile(r"mypy_boto3_(.*?)\.client")
-ClientNamePatternMatchGroup = 1
+ClientModulePrefix = "mypy_boto3_"
+
+# assumed role credentials are refreshed once they are this close to expiring
+CredentialsExpiryWindow = timedelta(minutes=5)
+
+# shared by all clients. Every fan-out shares one pool:
+# sso_admin_utils.MAX_DESCRIBE_WORKERS (10) describe threads per lookup,
+# sso_admin_utils.SSO_MAX_CONCURRENT_REQUESTS (20) requests per async lookup and
+# aws_acc_handler.MAX_CONCURRENT_TERMINATIONS (10) terminations. 64 connections leave
+# room for several lookups next to a full set of terminations. Both modules import
+# this one, so the constants cannot be imported here; keep the pool in step with them.
+# Adaptive retries rate-limit the client once the service starts throttling, instead
+# of failing the fan-out.
+MaxPoolConnections = 64
+ClientConfig = Config(
+    max_pool_connections=MaxPoolConnections,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+
+class AssumeRoleCredentialProvider(CredentialProvider):
+    """
+    botocore credential provider for the credentials of an assumed IAM role.
+
+    The credentials it loads are refreshable: once botocore considers them close to
+    expiring, it calls `load_metadata` again with `force_refresh=True`.
+    """
+
+    METHOD = "sts-assume-role"
+
+    def __init__(self, load_metadata: Callable[..., dict[str, str]]):
+        super().__init__()
+        self.load_metadata = load_metadata
+
+    def load(self) -> RefreshableCredentials:
+        return RefreshableCredentials.create_from_metadata(
+            metadata=self.load_metadata(),
+            refresh_using=functools.partial(self.load_metadata, force_refresh=True),
+            method=self.METHOD,
+        )
 
 
 class IAWSClientFactory(Protocol):
@@ -57,7 +106,18 @@ class AWSClientFactory:
     Factory class for creating AWS client instances.
     """
 
-    clients: dict[str, BaseClient] = {}
+    clients: dict[tuple[str, str, Optional[str]], BaseClient] = {}
+    sessions: dict[tuple[str, Optional[str]], boto3.session.Session] = {}
+    sts_credentials: dict[str, CredentialsTypeDef] = {}
+    # clients used in this project are resolved without inspecting their module name
+    service_names: dict[type, ServiceName] = {
+        IdentityStoreClient: "identitystore",
+        ServiceCatalogClient: "servicecatalog",
+        SSOAdminClient: "sso-admin",
+        STSClient: "sts",
+    }
+    # shared by all sessions, so every service model is read from disk once per process
+    data_loader: botocore.loaders.Loader = botocore.loaders.create_loader()
 
     @classmethod
     def get[
@@ -74,16 +134,22 @@ class AWSClientFactory:
         Args:
             client_class (Type[T]): The class of the AWS client to create.
             region (str, optional): The AWS region to use. Defaults to the value of the AWS_REGION environment variable.
-            role_arn (str, optional): The ARN of the IAM role to assume. Defaults to None.
+            role_arn (str, optional): The ARN of the IAM role to assume. Defaults to None, in which case
+                the default boto3 credential chain is used and STS is not called.
 
         Returns:
             T: An instance of the AWS client.
 
         """
-        return cls.clients.get(
-            f"{client_class.__name__}_{role_arn}",
-            cls.__create_aws_client(client_class, region, role_arn),
-        )
+        key = (client_class.__name__, region, role_arn)
+        client = cls.clients.get(key)
+        if client is None:
+            client = typing.cast(
+                BaseClient, cls.__create_aws_client(client_class, region, role_arn)
+            )
+            cls.clients[key] = client
+
+        return typing.cast(T, client)
 
     @classmethod
     def __create_aws_client[
@@ -101,58 +167,129 @@ class AWSClientFactory:
             T: The created AWS client.
 
         """
-        session_creds = cls.__get_sts_credentials(role_arn)
-        aws_client: T = boto3.client(
+        aws_client: T = cls.__get_session(region, role_arn).client(
             service_name=cls.__client_type_to_service_name(client_class),  # type: ignore
-            aws_access_key_id=session_creds["AccessKeyId"],
-            aws_secret_access_key=session_creds["SecretAccessKey"],
-            aws_session_token=session_creds["SessionToken"],
             region_name=region,
+            config=ClientConfig,
         )
 
-        cls.clients[f"{client_class.__name__}_{role_arn}"] = aws_client
-
         return aws_client
 
-    @staticmethod
-    def __client_type_to_service_name[T](client_class: T) -> ServiceName:  # type: ignore[valid-type, name-defined]
+    @classmethod
+    def __get_session(
+        cls, region: str, role_arn: Optional[str]
+    ) -> boto3.session.Session:
+        """
+        Get the boto3 session for the specified region and role ARN.
+
+        Args:
+            region (str): The AWS region to use.
+            role_arn (Optional[str]): The ARN of the IAM role to assume (optional).
+
+        Returns:
+            boto3.session.Session: The session all clients for this region and role are created from.
+
+        """
+        session = cls.sessions.get((region, role_arn))
+        if session is None:
+            botocore_session = botocore.session.get_session()
+            botocore_session.register_component("data_loader", cls.data_loader)
+            if role_arn is not None:
+                botocore_session.register_component(
+                    "credential_provider",
+                    CredentialResolver(
+                        [
+                            AssumeRoleCredentialProvider(
+                                functools.partial(
+                                    cls.__get_credentials_metadata, role_arn
+                                )
+                            )
+                        ]
+                    ),
+                )
+            session = boto3.session.Session(
+                botocore_session=botocore_session, region_name=region
+            )
+            cls.sessions[(region, role_arn)] = session
+
+        return session
+
+    @classmethod
+    def __client_type_to_service_name[T](cls, client_class: Type[T]) -> ServiceName:
         """
         Converts the client type to a service name.
 
         Args:
-            client_class (Type): The client class.
+            client_class (Type[T]): The client class.
 
         Returns:
             ServiceName: The converted service name.
         """
-        return (
-            ClientNamePattern.match(client_class.__module__)  # type: ignore[union-attr]
-            .group(ClientNamePatternMatchGroup)
-            .replace("_", "-")
-        )
+        service_name = cls.service_names.get(client_class)
+        if service_name is None:
+            service_name = typing.cast(
+                ServiceName,
+                client_class.__module__.removeprefix(ClientModulePrefix)
+                .split(".", 1)[0]
+                .replace("_", "-"),
+            )
+            cls.service_names[client_class] = service_name
+
+        return service_name
+
+    @classmethod
+    def __get_credentials_metadata(
+        cls, role_arn: str, force_refresh: bool = False
+    ) -> dict[str, str]:
+        """
+        Get STS credentials for the specified role ARN in the format expected by botocore.
+
+        Args:
+            role_arn (str): The ARN of the role to assume.
+            force_refresh (bool, optional): Assume the role again even if cached credentials are still valid. Defaults to False.
+
+        Returns:
+            dict[str, str]: The credentials metadata used by `RefreshableCredentials`.
+
+        """
+        session_creds = cls.__get_sts_credentials(role_arn, force_refresh)
+        return {
+            "access_key": session_creds["AccessKeyId"],
+            "secret_key": session_creds["SecretAccessKey"],
+            "token": session_creds["SessionToken"],
+            "expiry_time": session_creds["Expiration"].isoformat(),
+        }
 
     @classmethod
-    def __get_sts_credentials(cls, role_arn: Optional[str]) -> CredentialsTypeDef:
+    def __get_sts_credentials(
+        cls, role_arn: str, force_refresh: bool = False
+    ) -> CredentialsTypeDef:
         """
         Get STS credentials for the specified role ARN.
 
         Args:
-            role_arn (Optional[str]): The ARN of the role to assume.
+            role_arn (str): The ARN of the role to assume.
+            force_refresh (bool, optional): Assume the role again even if cached credentials are still valid. Defaults to False.
 
         Returns:
             CredentialsTypeDef: The STS credentials.
 
-        If `role_arn` is None, returns a dictionary with `AccessKeyId`, `SecretAccessKey`,
-        and `SessionToken` set to None.
+        Credentials are cached per role ARN and reused until they are within
+        `CredentialsExpiryWindow` of their expiration.
 
         """
-        if role_arn is None:
-            return typing.cast(
-                CredentialsTypeDef,
-                {k: None for k in ["AccessKeyId", "SecretAccessKey", "SessionToken"]},
-            )
-
-        sts_client = boto3.client("sts")
-        return sts_client.assume_role(
+        session_creds = cls.sts_credentials.get(role_arn)
+        if (
+            not force_refresh
+            and session_creds is not None
+            and session_creds["Expiration"] - datetime.now(timezone.utc)
+            > CredentialsExpiryWindow
+        ):
+            return session_creds
+
+        session_creds = cls.get(STSClient).assume_role(
             RoleArn=role_arn, RoleSessionName=f"{cls.__name__}_AssumeRoleSession"
         )["Credentials"]
+        cls.sts_credentials[role_arn] = session_creds
+
+        return session_creds
@@ -16,4 +16,14 @@ class OperationStatus(Enum):
 
     @classmethod
     def from_str(cls, value: str):
-        return cls.SUCCEEDED if value == "SUCCES" else cls.FAILED
+        return SC_RECORD_OPERATION_STATUSES.get(value, cls.FAILED)
+
+
+# Service Catalog record statuses and the operation status they represent
+SC_RECORD_OPERATION_STATUSES = {
+    "SUCCEEDED": OperationStatus.SUCCEEDED,
+    "FAILED": OperationStatus.FAILED,
+    "IN_PROGRESS": OperationStatus.IN_PROGRESS,
+    "IN_PROGRESS_IN_ERROR": OperationStatus.IN_PROGRESS,
+    "CREATED": OperationStatus.WAITING,
+}
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import json
+import logging
 import uuid
-from typing import Mapping
+from typing import Any, Iterable, Mapping
 
 from mypy_boto3_servicecatalog import ServiceCatalogClient
-from mypy_boto3_servicecatalog.type_defs import (ProvisioningParameterTypeDef,
-                                                 ProvisionProductOutputTypeDef)
+from mypy_boto3_servicecatalog.type_defs import ProvisioningParameterTypeDef
 from mypy_boto3_sso_admin import SSOAdminClient
 
 import core.utils as utils
@@ -18,12 +20,57 @@ from core.schemas.handler_response import (AWSHandlerResponse, OperationStatus,
 from core.schemas.ps_requests import PSConfigPayload
 from core.utils import logger
 
+# parameter keys of the "AWS Control Tower Account Factory" product
+ACCOUNT_FACTORY_PARAMETER_KEYS = (
+    "AccountName",
+    "AccountEmail",
+    "ManagedOrganizationalUnit",
+    "SSOUserEmail",
+    "SSOUserFirstName",
+    "SSOUserLastName",
+)
+
+# Service Catalog record statuses that mean the record is still being processed
+SC_RECORD_PENDING_STATUSES = frozenset(
+    {"IN_PROGRESS", "IN_PROGRESS_IN_ERROR", "CREATED"}
+)
+# provisioning or terminating a Control Tower account takes up to tens of minutes
+SC_RECORD_TIMEOUT = 3600
+SC_RECORD_MAX_DELAY = 30
+# keeps concurrent terminations below the Service Catalog API throttling limits
+MAX_CONCURRENT_TERMINATIONS = 10
+# account assignment statuses that mean the assignment is still being processed
+ACCOUNT_ASSIGNMENT_PENDING_STATUSES = frozenset({"IN_PROGRESS"})
+# account assignments usually complete within seconds
+ACCOUNT_ASSIGNMENT_TIMEOUT = 300
+
 
 class AWS:
     def __init__(self, aws_client_factory: IAWSClientFactory):
         self.aws_client_factory = aws_client_factory
+        self.sc_client = aws_client_factory.get(ServiceCatalogClient)
+        self.sso_client = aws_client_factory.get(SSOAdminClient)
+        self.__wait_for_record = utils.make_status_waiter(
+            self.sc_client.describe_record,
+            "RecordDetail",
+            SC_RECORD_PENDING_STATUSES,
+            max_delay=SC_RECORD_MAX_DELAY,
+            timeout=SC_RECORD_TIMEOUT,
+        )
+        self.__wait_for_assignment_creation = utils.make_status_waiter(
+            self.sso_client.describe_account_assignment_creation_status,
+            "AccountAssignmentCreationStatus",
+            ACCOUNT_ASSIGNMENT_PENDING_STATUSES,
+            timeout=ACCOUNT_ASSIGNMENT_TIMEOUT,
+        )
+        self.__wait_for_assignment_deletion = utils.make_status_waiter(
+            self.sso_client.describe_account_assignment_deletion_status,
+            "AccountAssignmentDeletionStatus",
+            ACCOUNT_ASSIGNMENT_PENDING_STATUSES,
+            timeout=ACCOUNT_ASSIGNMENT_TIMEOUT,
+        )
 
-    def terminate_control_tower_account(
+    async def terminate_control_tower_account(
         self, account_id: str
     ) -> AWSHandlerResponse | str:
         """
@@ -35,32 +82,77 @@ class AWS:
         Returns:
             str: A message indicating the result of the de-registration process.
         """
-        provisioned_products = []
-        sc_client = self.aws_client_factory.get(ServiceCatalogClient)
-        provisioned_products = sc_utils.get_sc_products_for_account(account_id)
+        provisioned_products = await utils.run_blocking(
+            sc_utils.get_sc_products_for_account, account_id, self.sc_client
+        )
 
-        if provisioned_products is None:
-            logger.info(f"No provisioned products found for {account_id}")
-            return
+        if not provisioned_products:
+            logger.info("No provisioned products found for %s", account_id)
+            return f"No provisioned products found for {account_id}"
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TERMINATIONS)
+        results = await asyncio.gather(
+            *(
+                self.__terminate_provisioned_product(provisioned_product, semaphore)
+                for provisioned_product in provisioned_products
+            ),
+            return_exceptions=True,
+        )
 
-        for provisioned_product in provisioned_products:
-            record_id_response = sc_client.terminate_provisioned_product(  # type: ignore[call-arg]
-                ProvisionedProductId=provisioned_product, IgnoreErrors=True
-            )
+        self.__raise_first_failure(
+            "Termination of provisioned product", provisioned_products, results
+        )
 
-            record_id = record_id_response["RecordDetail"]["RecordId"]
+        return f"Successfully terminated ControlTower account {account_id} from provisioned Service Catalog ID: {provisioned_products}"
+
+    @staticmethod
+    def __raise_first_failure(
+        operation: str, targets: Iterable[Any], results: Iterable[Any]
+    ) -> None:
+        """
+        Logs every failed operation of a gather and re-raises the first failure.
+
+        Used with `asyncio.gather(..., return_exceptions=True)`, so one failure does not
+        cancel the sibling operations while they are still waiting on AWS.
+
+        Args:
+            operation (str): Description of the operation, used in the log message.
+            targets (Iterable[Any]): The target of each operation, in gather order.
+            results (Iterable[Any]): The results returned by `asyncio.gather`.
+        """
+        errors = []
+        for target, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error("%s %s failed: %r", operation, target, result)
+                errors.append(result)
+        if errors:
+            raise errors[0]
+
+    async def __terminate_provisioned_product(
+        self, provisioned_product: str, semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """
+        Terminate a provisioned Service Catalog product and wait for the termination record to complete.
+
+        Args:
+            provisioned_product (str): The ID of the provisioned product to terminate.
+            semaphore (asyncio.Semaphore): Limits how many terminations run at the same time.
 
-            utils.block_until_complete(
-                task=sc_client.describe_record,
-                args=[],
-                kwargs={"Id": record_id},
-                condition=lambda x: x["RecordDetail"]["Status"]
-                in ["IN_PROGRESS", "IN_PROGRESS_IN_ERROR", "CREATED"],
+        Returns:
+            dict[str, Any]: The final describe_record response of the termination.
+        """
+        async with semaphore:
+            record_id_response = await utils.run_blocking(
+                self.sc_client.terminate_provisioned_product,
+                ProvisionedProductId=provisioned_product,
+                IgnoreErrors=True,
             )
 
-        return f"Successfully terminated ControlTower account {account_id} from provisioned Service Catalog ID: {provisioned_products}"
+            record_id = record_id_response["RecordDetail"]["RecordId"]
 
-    def create_control_tower_account(
+            return await self.__wait_for_record(Id=record_id)
+
+    async def create_control_tower_account(
         self,
         account_name: str,
         account_email: str,
@@ -68,7 +160,7 @@ class AWS:
         sso_user_email: str,
         sso_user_first_name: str,
         sso_user_last_name: str,
-    ) -> ProvisionProductOutputTypeDef:
+    ) -> AWSHandlerResponse:
         """
         Create a new account in AWS Control Tower via AWS Service Catalog.
 
@@ -84,26 +176,34 @@ class AWS:
         - response: The response from the provisioning of the new account.
 
         """
-        sc_client = self.aws_client_factory.get(ServiceCatalogClient)
         account_request_id = str(uuid.uuid4())
 
-        product_id = sc_utils.get_service_catalog_product_id(
-            "AWS Control Tower Account Factory"
+        product_id = await utils.run_blocking(
+            sc_utils.get_service_catalog_product_id, "AWS Control Tower Account Factory"
+        )
+        provisioning_artifact_id = await utils.run_blocking(
+            sc_utils.get_product_artifact_id, product_id
         )
-        provisioning_artifact_id = sc_utils.get_product_artifact_id(product_id)
 
         # Provisioning parameters for the account creation
         provisioning_parameters: list[ProvisioningParameterTypeDef] = [
-            {"Key": "AccountName", "Value": account_name},
-            {"Key": "AccountEmail", "Value": account_email},
-            {"Key": "ManagedOrganizatialUnit", "Value": ou_name},
-            {"Key": "SSOUserEmail", "Value": sso_user_email},
-            {"Key": "SSOUserFirstName", "Value": sso_user_first_name},
-            {"Key": "SSOUserLastName", "Value": sso_user_last_name},
+            {"Key": key, "Value": value}
+            for key, value in zip(
+                ACCOUNT_FACTORY_PARAMETER_KEYS,
+                (
+                    account_name,
+                    account_email,
+                    ou_name,
+                    sso_user_email,
+                    sso_user_first_name,
+                    sso_user_last_name,
+                ),
+            )
         ]
 
         # Provision the new account
-        response = sc_client.provision_product(
+        response = await utils.run_blocking(
+            self.sc_client.provision_product,
             ProductId=product_id,
             ProvisioningArtifactId=provisioning_artifact_id,
             ProvisionedProductName=f"AccountCreation-{account_request_id}",
@@ -113,13 +213,7 @@ class AWS:
 
         record_id = response["RecordDetail"]["RecordId"]
 
-        task_response = utils.block_until_complete(
-            task=sc_client.describe_record,
-            args=[],
-            kwargs={"Id": record_id},
-            condition=lambda x: x["RecordDetail"]["Status"]
-            in ["IN_PROGRESS", "IN_PROGRESS_IN_ERROR", "CREATED"],
-        )
+        task_response = await self.__wait_for_record(Id=record_id)
 
         op_status = OperationStatus.from_str(task_response["RecordDetail"]["Status"])
 
@@ -133,7 +227,7 @@ class AWS:
         )
 
     # TODO: Rewrite return value
-    def add_account_to_ps(
+    async def add_account_to_ps(
         self, account_id: str, ps_name: str, group_name: str
     ) -> dict[str, PSConfigPayload]:
         """
@@ -151,69 +245,138 @@ class AWS:
             None
 
         """
-        sso_client = self.aws_client_factory.get(SSOAdminClient)
-        ps_data = sso_admin_utils.get_ps_details_for_name(
-            account_id, ps_name, group_name
+        ps_data = await utils.run_blocking(
+            sso_admin_utils.get_ps_details_for_name, account_id, ps_name, group_name
         )
-        if ps_data is None:
+        if not ps_data:
             return {}
 
-        for ps_payload in ps_data:
-            ps_response = sso_client.create_account_assignment(**ps_payload)[
-                "AccountAssignmentCreationStatus"
-            ]
-            logger.info(
-                f"Creation status {ps_response['Status']} for {ps_name} permission set"
+        results = await asyncio.gather(
+            *(
+                self.__create_account_assignment(ps_name, ps_payload)
+                for ps_payload in ps_data
+            ),
+            return_exceptions=True,
+        )
+        self.__raise_first_failure(
+            f"Creation of {ps_name} account assignment in instance",
+            (ps_payload.InstanceArn for ps_payload in ps_data),
+            results,
+        )
+
+        return {ps_name: ps_data[-1]}
+
+    async def __create_account_assignment(
+        self, ps_name: str, ps_payload: PSConfigPayload
+    ) -> Mapping[str, Any]:
+        """
+        Creates an account assignment and waits for the creation to complete.
+
+        Args:
+            ps_name (str): The name of the permission set.
+            ps_payload (PSConfigPayload): The account assignment to create.
+
+        Returns:
+            Mapping[str, Any]: The final account assignment creation status.
+        """
+        payload_dict = dataclasses.asdict(ps_payload)
+        ps_response = (
+            await utils.run_blocking(
+                self.sso_client.create_account_assignment, **payload_dict
             )
+        )["AccountAssignmentCreationStatus"]
+        logger.info(
+            "Creation status %s for %s permission set",
+            ps_response["Status"],
+            ps_name,
+        )
 
-            ps_create_status = utils.block_until_complete(
-                task=sso_client.describe_account_assignment_creation_status,
-                args=[],
-                kwargs={
-                    "InstanceArn": ps_payload.InstanceArn,
-                    "AccountAssignmentCreationRequestId": ps_response["RequestId"],
-                },
-                condition=lambda x: x["AccountAssignmentCreationStatus"]["Status"]
-                in ["IN_PROGRESS"],
+        ps_create_status = (
+            await self.__wait_for_assignment_creation(
+                InstanceArn=payload_dict["InstanceArn"],
+                AccountAssignmentCreationRequestId=ps_response["RequestId"],
             )
-            if ps_create_status["Status"] == "FAILED":
-                logger.info(
-                    f"Create failed for {ps_name}. Fail status message: {ps_create_status['FailureReason']}"
-                )
+        )["AccountAssignmentCreationStatus"]
 
-            ps_create_data = {ps_name: ps_payload}
+        if ps_create_status["Status"] == "FAILED":
+            logger.info(
+                "Create failed for %s. Fail status message: %s",
+                ps_name,
+                ps_create_status["FailureReason"],
+            )
 
-        return ps_create_data
+        return ps_create_status
 
-    def remove_account_from_ps(self, account_id: str) -> Mapping[str, PSConfigPayload]:
-        sso_client = self.aws_client_factory.get(SSOAdminClient)
-        ps_list_payload = sso_admin_utils.get_ps_details_for_account(account_id)
-        if ps_list_payload is None:
+    async def remove_account_from_ps(
+        self, account_id: str
+    ) -> Mapping[str, PSConfigPayload]:
+        ps_list_payload = await sso_admin_utils.aget_ps_details_for_account(account_id)
+        if not ps_list_payload:
             return {}
 
-        for ps_name, ps_payload in ps_list_payload.items():
-            ps_delete_status = sso_client.delete_account_assignment(**ps_payload)[
-                "AccountAssignmentDeletionStatus"
-            ]
+        results = await asyncio.gather(
+            *(
+                self.__delete_account_assignment(ps_name, ps_payload)
+                for ps_name, ps_payload in ps_list_payload.items()
+            ),
+            return_exceptions=True,
+        )
+        self.__raise_first_failure(
+            "Deletion of account assignment for permission set",
+            ps_list_payload,
+            results,
+        )
+
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"Deletion status {ps_delete_status['Status']} for {ps_name} permission set"
+                "Permission sets deleted: %s",
+                json.dumps(
+                    {
+                        ps_name: dataclasses.asdict(ps_payload)
+                        for ps_name, ps_payload in ps_list_payload.items()
+                    },
+                    indent=2,
+                ),
             )
+        return ps_list_payload
+
+    async def __delete_account_assignment(
+        self, ps_name: str, ps_payload: PSConfigPayload
+    ) -> Mapping[str, Any]:
+        """
+        Deletes an account assignment and waits for the deletion to complete.
 
-            ps_delete_status = utils.block_until_complete(
-                task=sso_client.describe_account_assignment_deletion_status,
-                args=[],
-                kwargs={
-                    "InstanceArn": ps_payload.InstanceArn,
-                    "AccountAssignmentDeletionRequestId": ps_delete_status["RequestId"],
-                },
-                condition=lambda x: x["AccountAssignmentDeletionStatus"]["Status"]
-                in ["IN_PROGRESS"],
+        Args:
+            ps_name (str): The name of the permission set.
+            ps_payload (PSConfigPayload): The account assignment to delete.
+
+        Returns:
+            Mapping[str, Any]: The final account assignment deletion status.
+        """
+        payload_dict = dataclasses.asdict(ps_payload)
+        ps_delete_status = (
+            await utils.run_blocking(
+                self.sso_client.delete_account_assignment, **payload_dict
             )
+        )["AccountAssignmentDeletionStatus"]
+        logger.info(
+            "Deletion status %s for %s permission set",
+            ps_delete_status["Status"],
+            ps_name,
+        )
 
-            if ps_delete_status["Status"] == "FAILED":
-                logger.info(
-                    f"Delete failed for {ps_name}. Fail status message: {ps_delete_status['FailureReason']}"
-                )
+        ps_delete_status = (
+            await self.__wait_for_assignment_deletion(
+                InstanceArn=payload_dict["InstanceArn"],
+                AccountAssignmentDeletionRequestId=ps_delete_status["RequestId"],
+            )
+        )["AccountAssignmentDeletionStatus"]
 
-        logger.info(f"Permission sets deleted: {json.dumps(ps_list_payload, indent=2)}")
-        return ps_list_payload
+        if ps_delete_status["Status"] == "FAILED":
+            logger.info(
+                "Delete failed for %s. Fail status message: %s",
+                ps_name,
+                ps_delete_status["FailureReason"],
+            )
+
+        return ps_delete_status
@@ -0,0 +1,17 @@
+import logging
+import os
+
+
+def configure_logging() -> None:
+    """Configures the root logger used by `core.utils.logger`.
+
+    Must be called once from the application entry point. The level is read from the
+    `logger_level` environment variable (any standard level name, case-insensitive) and
+    defaults to INFO when the variable is unset or not a known level.
+    """
+    logging.basicConfig(format="%(asctime)s %(message)s")
+    logging.getLogger().setLevel(
+        logging.getLevelNamesMapping().get(
+            os.getenv("logger_level", "INFO").upper(), logging.INFO
+        )
+    )
@@ -1,6 +0,0 @@
-from core.schemas.provisioned_products_response import (
-    ProvisionedProduct,
-    SearchProvisionedProductsResponse,
-)
-
-__all__ = ["ProvisionedProduct", "SearchProvisionedProductsResponse"]
@@ -1,47 +1,171 @@
+import asyncio
+import functools
 import logging
+import operator
 import os
+import random
+import threading
 import time
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Coroutine, Mapping, Optional
 
-# INSTANCE_ARNS = get_instance_arns()
 
 logger = logging.getLogger()
-logging.basicConfig(format="%(asctime)s %(message)s")
-logger.setLevel(logging.INFO if os.getenv("logger_level") else logging.DEBUG)
 
+BLOCK_TIMEOUT = float(os.getenv("block_timeout", 30))
 
-def block_until_complete(
+
+async def run_blocking[T](task: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a blocking call in the default executor.
+
+    boto3 calls block on network IO, so running them here lets the event loop serve other
+    coroutines, e.g. the other operations of an `asyncio.gather`, in the meantime.
+
+    Args:
+        task (Callable): The blocking callable to run.
+        *args: Positional arguments to pass to the task.
+        **kwargs: Keyword arguments to pass to the task.
+
+    Returns:
+        T: The result of the task.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(task, *args, **kwargs))
+
+
+async def block_until_complete(
     task: Callable[..., Any],
     args: list[Any],
     kwargs: Mapping[str, Any],
     condition: Callable[..., bool],
-    sleep_time: float = 5,
-    timeout: float = 30,
+    base_delay: float = 0.25,
+    max_delay: float = 8,
+    max_attempts: Optional[int] = None,
+    timeout: float = BLOCK_TIMEOUT,
 ) -> dict[str, Any]:
     """Executes a task repeatedly until a condition is met or a timeout occurs.
 
+    Retries use exponential backoff with full jitter: before attempt `n` the task waits a
+    random time between 0 and `min(max_delay, base_delay * 2**n)`. The task is run in the
+    default executor, so other coroutines keep running while it blocks on the AWS API.
+
     Args:
         task (Callable): The callable task to execute.
         args (list): A list of arguments to pass to the task.
         kwargs (Mapping[str, Any]): A dictionary of keyword arguments to pass to the task.
         condition (Callable): A callable that takes the task's response and returns a bool.
-        sleep_time (float, optional): Time to wait between retries (in seconds). Defaults to 5.
-        timeout (float, optional): Maximum time to wait for the condition to be met (in seconds). Defaults to 30.
+        base_delay (float, optional): Base time to wait between retries (in seconds). Defaults to 0.25.
+        max_delay (float, optional): Maximum time to wait between retries (in seconds). Defaults to 8.
+        max_attempts (int, optional): Maximum number of times the task is executed. Defaults to no limit.
+        timeout (float, optional): Maximum time to wait for the condition to be met (in seconds).
+            Defaults to the `block_timeout` environment variable or 30.
 
     Raises:
-        TimeoutError: If the operation times out.
+        TimeoutError: If the operation times out or runs out of attempts.
     """
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    attempts = 0
 
-    response = task(*args, **kwargs)
-    logger.info(f"Initial request: {response}")
+    while True:
+        response = await run_blocking(task, *args, **kwargs)
+        attempts += 1
+        logger.info("Running request: %s", response)
+        if not condition(response):
+            return response
 
-    # TODO: Because AWS API is used, can we proceed after sleep_time reached?
-    while condition(response):
-        if time.time() - start_time > timeout:
+        if max_attempts is not None and attempts >= max_attempts:
+            raise TimeoutError(f"Operation did not complete after {attempts} attempts.")
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
             raise TimeoutError("Operation timed out.")
-        time.sleep(sleep_time)
-        response = task(*args, **kwargs)
-        logger.info(f"Running request: {response}")
+        # never sleep past the deadline, so the last poll happens right before it
+        await asyncio.sleep(
+            min(remaining, random.uniform(0, min(max_delay, base_delay * 2**attempts)))
+        )
+
+
+def make_status_waiter(
+    describe_fn: Callable[..., Any],
+    status_key: str,
+    pending_statuses: frozenset[str],
+    base_delay: float = 0.25,
+    max_delay: float = 8,
+    max_attempts: Optional[int] = None,
+    timeout: float = BLOCK_TIMEOUT,
+) -> Callable[..., Coroutine[Any, Any, dict[str, Any]]]:
+    """Creates a waiter that polls a describe call until its status is no longer pending.
+
+    The returned coroutine function takes the keyword arguments of `describe_fn` and
+    waits, like `block_until_complete`, until `response[status_key]["Status"]` is not in
+    `pending_statuses`.
+
+    Args:
+        describe_fn (Callable): The describe call to poll.
+        status_key (str): The key of the response object holding the `Status` field.
+        pending_statuses (frozenset[str]): The statuses that mean the operation is still running.
+        base_delay (float, optional): Base time to wait between retries (in seconds). Defaults to 0.25.
+        max_delay (float, optional): Maximum time to wait between retries (in seconds). Defaults to 8.
+        max_attempts (int, optional): Maximum number of times the task is executed. Defaults to no limit.
+        timeout (float, optional): Maximum time to wait for the status to change (in seconds).
+            Defaults to the `block_timeout` environment variable or 30.
+
+    Returns:
+        Callable: A coroutine function returning the last describe response.
+    """
+
+    get_status_object = operator.itemgetter(status_key)
+
+    def is_pending(response: Mapping[str, Any]) -> bool:
+        return get_status_object(response)["Status"] in pending_statuses
+
+    async def wait(**kwargs: Any) -> dict[str, Any]:
+        return await block_until_complete(
+            task=describe_fn,
+            args=[],
+            kwargs=kwargs,
+            condition=is_pending,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            max_attempts=max_attempts,
+            timeout=timeout,
+        )
+
+    return wait
+
+
+def ttl_cache[T](ttl: float) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Caches the results of a function for a limited time.
+
+    Results are keyed on the positional arguments of the call and the cache is safe to use
+    from multiple threads. Exceptions are not cached, so a failed lookup is retried on the
+    next call. The cache can be emptied with the `cache_clear` attribute of the decorated
+    function.
+
+    Args:
+        ttl (float): Time (in seconds) a cached result stays valid.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        cache: dict[tuple[Any, ...], tuple[T, float]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> T:
+            now = time.monotonic()
+            with lock:
+                cached = cache.get(args)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+
+            value = func(*args)
+            with lock:
+                cache[args] = (value, now + ttl)
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
 
-    return response
+    return decorator
@@ -1,69 +1,60 @@
-from typing import Optional
+import itertools
+from typing import Any, Optional
 
 from mypy_boto3_servicecatalog import ServiceCatalogClient
 
 from core.authentication.aws_client_factory import AWSClientFactory
-from core.schemas import SearchProvisionedProductsResponse
-from core.utils import logger
+from core.utils import logger, ttl_cache
+
+# product and artifact IDs only change when the product is republished
+SC_METADATA_TTL = 300
+# largest page size accepted by the Service Catalog search APIs
+SC_MAX_PAGE_SIZE = 100
 
 
 # TODO: Review function code
-def get_sc_products_for_account(account_id: str) -> list[str]:
+def get_sc_products_for_account(
+    account_id: str, sc_client: Optional[ServiceCatalogClient] = None
+) -> list[str]:
     """
     Retrieves the list of Service Catalog product IDs for a given account.
 
     Args:
         account_id (str): The ID of the account.
+        sc_client (ServiceCatalogClient, optional): The Service Catalog client to use.
+            Defaults to the client from `AWSClientFactory`.
 
     Returns:
         list[str]: A list of Service Catalog product IDs.
 
     """
-    sc_product_ids = []
-    sc_client = AWSClientFactory.get(ServiceCatalogClient)
-    response = sc_client.search_provisioned_products(
-        AccessLevelFilter={"Key": "Account", "Value": "self"},
-        Filters={"SearchQuery": [account_id]},
-    )
-
-    try:
-        sc_response = SearchProvisionedProductsResponse(**response)  # type: ignore[call-arg]
-    except TypeError:
-        return []
-
-    for sc_provisioned_product in sc_response.ProvisionedProducts:
-        if sc_provisioned_product.Status == "AVAILABLE":
-            sc_product_ids.append(sc_provisioned_product.Id)
-
-    return sc_product_ids
-
-
-def get_artifact_id_if_current(
-    artifact_and_product_id: tuple[str, str]
-) -> Optional[str]:
-    """
-    Retrieves the artifact ID if it is currently active for the given product ID.
-
-    Args:
-        - artifact_and_product_id: A tuple containing the artifact ID and product ID.
-
-    Returns:
-        The artifact ID if it is currently active, otherwise None.
-    """
-    product_id, artifact_id = artifact_and_product_id
-    sc_client = AWSClientFactory.get(ServiceCatalogClient)
-    response = sc_client.describe_provisioning_artifact(
-        ProductId=product_id,
-        ProvisioningArtifactId=artifact_id,
-    )
+    sc_product_ids: list[str] = []
+    if sc_client is None:
+        sc_client = AWSClientFactory.get(ServiceCatalogClient)
+    # botocore has no paginator for search_provisioned_products, so pages are followed
+    # by hand. Only the account ID is searched for: how several SearchQuery terms
+    # combine is undocumented, and matching too broadly here terminates other products.
+    search_kwargs: dict[str, Any] = {
+        "AccessLevelFilter": {"Key": "Account", "Value": "self"},
+        "Filters": {"SearchQuery": [account_id]},
+        "PageSize": SC_MAX_PAGE_SIZE,
+    }
+
+    while True:
+        response = sc_client.search_provisioned_products(**search_kwargs)
+        sc_product_ids.extend(
+            sc_provisioned_product["Id"]
+            for sc_provisioned_product in response.get("ProvisionedProducts", [])
+            if sc_provisioned_product.get("Status") == "AVAILABLE"
+        )
 
-    return (
-        artifact_id
-        if response["ProvisioningArtifactDetail"].get("Active", False)
-        else None
-    )
+        next_page_token = response.get("NextPageToken")
+        if not next_page_token:
+            return sc_product_ids
+        search_kwargs["PageToken"] = next_page_token
 
 
+@ttl_cache(SC_METADATA_TTL)
 def get_product_artifact_id(product_id: str) -> str:
     """
     Retrieves the artifact ID for a given product ID.
@@ -72,34 +63,22 @@ def get_product_artifact_id(product_id: str) -> str:
         product_id (str): The ID of the product.
 
     Returns:
-        str: The artifact ID of the product.
+        str: The ID of the first active artifact of the product.
 
     Raises:
         ValueError: If no active artifact is found for the product.
     """
     sc_client = AWSClientFactory.get(ServiceCatalogClient)
-    response = sc_client.describe_product_as_admin(Id=product_id)
+    response = sc_client.list_provisioning_artifacts(ProductId=product_id)
 
-    artifact_summary = response["ProvisioningArtifactSummaries"]
+    for artifact in response["ProvisioningArtifactDetails"]:
+        if artifact.get("Active", False):
+            return artifact["Id"]
 
-    try:
-        return next(
-            (
-                id
-                for id in map(
-                    get_artifact_id_if_current,
-                    (
-                        (product_id, artifact_id.get("Id", ""))
-                        for artifact_id in artifact_summary
-                    ),
-                )
-                if id
-            )
-        )
-    except StopIteration:
-        raise ValueError(f"No active artifact found for product: {product_id}")
+    raise ValueError(f"No active artifact found for product: {product_id}")
 
 
+@ttl_cache(SC_METADATA_TTL)
 def get_service_catalog_product_id(product_name_keyword: str) -> str:
     """
     Retrieves the ID of a service catalog product based on a keyword.
@@ -111,24 +90,36 @@ def get_service_catalog_product_id(product_name_keyword: str) -> str:
         str: The ID of the matching product.
 
     Raises:
-        ValueError: If multiple products are found for the given keyword.
+        ValueError: If no product or multiple products are found for the given keyword.
     """
 
     sc_client = AWSClientFactory.get(ServiceCatalogClient)
-    response = sc_client.search_products_as_admin(
-        Filters={"FullTextSearch": [product_name_keyword]}
+    paginator = sc_client.get_paginator("search_products_as_admin")
+    keyword = product_name_keyword.casefold()
+    product_summaries = (
+        product.get("ProductViewSummary", {})
+        for page in paginator.paginate(
+            Filters={"FullTextSearch": [product_name_keyword]},
+            PaginationConfig={"PageSize": SC_MAX_PAGE_SIZE},
+        )
+        for product in page.get("ProductViewDetails", [])
+    )
+    # two matches are enough to tell the keyword is ambiguous
+    matching_products = list(
+        itertools.islice(
+            (
+                product_summary.get("ProductId", "")
+                for product_summary in product_summaries
+                if keyword in product_summary.get("Name", "").casefold()
+            ),
+            2,
+        )
     )
-    # logger.info(response)
-    matching_products = [
-        product.get("ProductViewSummary", {}).get("ProductId", "")
-        for product in response["ProductViewDetails"]
-        if product_name_keyword.lower()
-        in product.get("ProductViewSummary", {}).get("Name", "").lower()
-    ]
 
     if not matching_products:
-        logger.warning(f"No products found for keyword: {product_name_keyword}")
-    if len(matching_products) != 1:
+        logger.warning("No products found for keyword: %s", product_name_keyword)
+        raise ValueError(f"No products found for keyword: {product_name_keyword}")
+    if len(matching_products) > 1:
         raise ValueError(f"Multiple products found for keyword: {product_name_keyword}")
 
     return matching_products[0]
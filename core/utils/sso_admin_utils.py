@@ -1,17 +1,33 @@
+import asyncio
+import functools
 from collections import namedtuple
-from typing import Mapping, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Mapping, Optional, cast
 
 from mypy_boto3_identitystore import IdentityStoreClient
+from mypy_boto3_identitystore.type_defs import AlternateIdentifierTypeDef
 from mypy_boto3_sso_admin import SSOAdminClient
 
 from core.authentication.aws_client_factory import AWSClientFactory
 from core.schemas.ps_requests import PSConfigPayload
-from core.utils import logger
+from core.utils import logger, run_blocking, ttl_cache
+
+# SSO instances are effectively static for an organization
+SSO_INSTANCE_TTL = 3600
+# permission sets can be created or renamed while a warm process keeps running
+PS_NAME_INDEX_TTL = 300
+MAX_DESCRIBE_WORKERS = 10
+# largest page size accepted by the SSO Admin list APIs
+SSO_MAX_PAGE_SIZE = 100
+# caps the SSO Admin requests an async fan-out has in flight; this bounds concurrency,
+# not the request rate, which the clients' adaptive retries keep within the API limits
+SSO_MAX_CONCURRENT_REQUESTS = 20
 
 PrincipalDetails = namedtuple("PrincipalDetails", ["principal_type", "principal_id"])
 IAMSSOInstance = namedtuple("IAMSSOInstance", ["identity_store_id", "instance_arn"])
 
 
+@ttl_cache(SSO_INSTANCE_TTL)
 def get_iam_sso_instance_data() -> list[IAMSSOInstance]:
     """
     Retrieves the ARNs (Amazon Resource Names) of all SSO instances.
@@ -19,41 +35,157 @@ def get_iam_sso_instance_data() -> list[IAMSSOInstance]:
     Returns:
         A list of IAMSSOInstance objects containing the IdentityStoreId and InstanceArn.
     """
-    sso_response = AWSClientFactory.get(SSOAdminClient).list_instances()
+    paginator = AWSClientFactory.get(SSOAdminClient).get_paginator("list_instances")
 
     return [
-        IAMSSOInstance(instance["IdentityStoreId"], instance["InstanceArn"]) for instance in sso_response["Instances"]
+        IAMSSOInstance(instance["IdentityStoreId"], instance["InstanceArn"])
+        for page in paginator.paginate()
+        for instance in page["Instances"]
     ]
 
 
-def get_ps_details_for_account(account_id: str) -> Mapping[str, PSConfigPayload]:
+def get_ps_details_for_account(
+    account_id: str, instances: Optional[list[IAMSSOInstance]] = None
+) -> Mapping[str, PSConfigPayload]:
     """
     Retrieves a dictionary of permission sets (PS) for a given account.
 
     Args:
         account_id (str): The ID of the account.
+        instances (list[IAMSSOInstance], optional): The SSO instances to search. Defaults to
+            `get_iam_sso_instance_data()`; callers iterating over many accounts can resolve
+            the instances once and pass them in.
 
     Returns:
         Mapping[str, PSConfigPayload]: A dictionary where the keys are the PS names and the values are PSConfigPayload objects.
 
     """
-    ps_data = {}
-    for instance_data in get_iam_sso_instance_data():
-        for ps_name, ps_arn in get_ps_name_arn_for_account(
-            instance_data.instance_arn, account_id
-        ).items():
-            principal_details = get_ps_principal_details(
-                account_id, instance_data.instance_arn, ps_arn
+    if instances is None:
+        instances = get_iam_sso_instance_data()
+    instance_arns = [instance_data.instance_arn for instance_data in instances]
+    with ThreadPoolExecutor(max_workers=MAX_DESCRIBE_WORKERS) as executor:
+        instance_ps_lists = executor.map(
+            functools.partial(get_ps_list_for_account, account_id=account_id),
+            instance_arns,
+        )
+        ps_targets = _ps_targets(instance_arns, instance_ps_lists)
+        target_instance_arns = [instance_arn for instance_arn, _ in ps_targets]
+        target_ps_arns = [ps_arn for _, ps_arn in ps_targets]
+        # names and principals only depend on the ARNs, so both waves are queued at once
+        ps_names = executor.map(get_ps_name, target_instance_arns, target_ps_arns)
+        principals = executor.map(
+            functools.partial(get_ps_principal_details, account_id),
+            target_instance_arns,
+            target_ps_arns,
+        )
+        return _ps_payloads(account_id, ps_targets, ps_names, principals)
+
+
+async def aget_ps_details_for_account(
+    account_id: str, instances: Optional[list[IAMSSOInstance]] = None
+) -> Mapping[str, PSConfigPayload]:
+    """
+    Async variant of `get_ps_details_for_account` for use from coroutines.
+
+    Every SSO Admin call runs in the default executor and all of them are gathered at
+    once, with at most `SSO_MAX_CONCURRENT_REQUESTS` in flight at a time.
+
+    Args:
+        account_id (str): The ID of the account.
+        instances (list[IAMSSOInstance], optional): The SSO instances to search. Defaults to
+            `get_iam_sso_instance_data()`.
+
+    Returns:
+        Mapping[str, PSConfigPayload]: A dictionary where the keys are the PS names and the values are PSConfigPayload objects.
+    """
+    semaphore = asyncio.Semaphore(SSO_MAX_CONCURRENT_REQUESTS)
+
+    async def call[T](task: Callable[..., T], *args: Any) -> T:
+        async with semaphore:
+            return await run_blocking(task, *args)
+
+    if instances is None:
+        instances = await call(get_iam_sso_instance_data)
+    instance_arns = [instance_data.instance_arn for instance_data in instances]
+
+    instance_ps_lists = await asyncio.gather(
+        *(
+            call(get_ps_list_for_account, instance_arn, account_id)
+            for instance_arn in instance_arns
+        )
+    )
+    ps_targets = _ps_targets(instance_arns, instance_ps_lists)
+    ps_names, principals = await asyncio.gather(
+        asyncio.gather(
+            *(
+                call(get_ps_name, instance_arn, ps_arn)
+                for instance_arn, ps_arn in ps_targets
             )
-            ps_data[ps_name] = PSConfigPayload(
-                InstanceArn=instance_data.instance_arn,
-                TargetId=account_id,
-                PermissionSetArn=ps_arn,
-                PrincipalType=principal_details.principal_type,
-                PrincipalId=principal_details.principal_id,
+        ),
+        asyncio.gather(
+            *(
+                call(get_ps_principal_details, account_id, instance_arn, ps_arn)
+                for instance_arn, ps_arn in ps_targets
             )
+        ),
+    )
+
+    return _ps_payloads(account_id, ps_targets, ps_names, principals)
+
+
+def _ps_targets(
+    instance_arns: Iterable[str], instance_ps_lists: Iterable[list[str]]
+) -> list[tuple[str, str]]:
+    """
+    Flattens per-instance permission set listings.
+
+    Args:
+        instance_arns (Iterable[str]): The ARNs of the SSO instances.
+        instance_ps_lists (Iterable[list[str]]): The permission set ARNs of each instance.
+
+    Returns:
+        list[tuple[str, str]]: An (instance ARN, PS ARN) pair for every permission set.
+    """
+    return [
+        (instance_arn, ps_arn)
+        for instance_arn, ps_list in zip(instance_arns, instance_ps_lists)
+        for ps_arn in ps_list
+    ]
+
+
+def _ps_payloads(
+    account_id: str,
+    ps_targets: list[tuple[str, str]],
+    ps_names: Iterable[str],
+    principals: Iterable[Optional[PrincipalDetails]],
+) -> dict[str, PSConfigPayload]:
+    """
+    Builds the account assignment payloads of the permission sets of an account.
+
+    Args:
+        account_id (str): The ID of the account.
+        ps_targets (list[tuple[str, str]]): The (instance ARN, PS ARN) pairs.
+        ps_names (Iterable[str]): The name of each permission set, in `ps_targets` order.
+        principals (Iterable[Optional[PrincipalDetails]]): The principal of each permission
+            set, in `ps_targets` order. Permission sets without one are left out.
+
+    Returns:
+        dict[str, PSConfigPayload]: The payloads keyed by permission set name.
+    """
+    return {
+        ps_name: PSConfigPayload(
+            InstanceArn=instance_arn,
+            TargetId=account_id,
+            PermissionSetArn=ps_arn,
+            PrincipalType=principal_details.principal_type,
+            PrincipalId=principal_details.principal_id,
+        )
+        for (instance_arn, ps_arn), ps_name, principal_details in zip(
+            ps_targets, ps_names, principals
+        )
+        if principal_details is not None
+    }
 
-    return ps_data
 
 def get_ps_details_for_name(
     account_id: str, ps_name: str, group_name: str
@@ -77,12 +209,12 @@ def get_ps_details_for_name(
         ps_arn = get_ps_arn_for_name(ps_name, instance_arn)
         if ps_arn is None:
             logger.info(
-                f"Permission set {ps_name} not found in instance {instance_arn}"
+                "Permission set %s not found in instance %s", ps_name, instance_arn
             )
             continue
         group_id = get_group_id_by_name(group_name, identity_id)
         if group_id is None:
-            logger.info(f"Group {group_name} not found in identity {identity_id}")
+            logger.info("Group %s not found in identity %s", group_name, identity_id)
             continue
         
         ps_data_payload.append(PSConfigPayload(
@@ -106,12 +238,40 @@ def get_ps_name_arn_for_account(instance_arn, account_id) -> Mapping[str, str]:
     Returns:
         Mapping[str, str]: A dictionary mapping permission set names to their ARNs.
     """
-    sso_client = AWSClientFactory.get(SSOAdminClient)
-    ps_list = sso_client.list_permission_sets_provisioned_to_account(
-        InstanceArn=instance_arn, AccountId=account_id
-    )["PermissionSets"]
+    ps_list = get_ps_list_for_account(instance_arn, account_id)
+
+    if not ps_list:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_DESCRIBE_WORKERS, len(ps_list))
+    ) as executor:
+        ps_names = executor.map(functools.partial(get_ps_name, instance_arn), ps_list)
+        return dict(zip(ps_names, ps_list))
+
+
+def get_ps_list_for_account(instance_arn: str, account_id: str) -> list[str]:
+    """
+    Retrieves the ARNs of the permission sets provisioned to an AWS account.
+
+    Args:
+        instance_arn (str): The ARN of the SSO instance.
+        account_id (str): The ID of the AWS account.
 
-    return {get_ps_name(instance_arn, ps_arn): ps_arn for ps_arn in ps_list}
+    Returns:
+        list[str]: A list of permission set ARNs.
+    """
+    sso_client = AWSClientFactory.get(SSOAdminClient)
+    paginator = sso_client.get_paginator("list_permission_sets_provisioned_to_account")
+    return [
+        ps_arn
+        for page in paginator.paginate(
+            InstanceArn=instance_arn,
+            AccountId=account_id,
+            PaginationConfig={"PageSize": SSO_MAX_PAGE_SIZE},
+        )
+        for ps_arn in page.get("PermissionSets", [])
+    ]
 
 
 def get_ps_arn_for_name(ps_name: str, instance_arn: str) -> Optional[str]:
@@ -122,37 +282,64 @@ def get_ps_arn_for_name(ps_name: str, instance_arn: str) -> Optional[str]:
         ps_name (str): The name of the PS to retrieve the ARN for.
 
     Returns:
-        Mapping[str, str]: A dictionary containing the ARN of the PS, with the PS name as the key.
+        Optional[str]: The ARN of the PS whose name equals `ps_name`, or else of the first
+            PS whose name contains it. None if no PS matches.
+
+    """
+    return find_first_matching_ps_name(_ps_name_index(instance_arn), ps_name)
 
+
+@ttl_cache(PS_NAME_INDEX_TTL)
+def _ps_name_index(instance_arn: str) -> dict[str, str]:
+    """
+    Builds a name to ARN index of all permission sets of an SSO instance.
+
+    The permission sets are listed once and described concurrently, so repeated name
+    lookups against the same instance need no further API calls until the index expires.
+
+    Args:
+        instance_arn (str): The ARN of the SSO instance.
+
+    Returns:
+        dict[str, str]: Permission set names mapped to their ARNs, in listing order.
     """
     ps_list = get_full_ps_list_for_instance(instance_arn)
-    ps_arn = find_first_matching_ps_name(ps_list, instance_arn, ps_name)
-    if ps_arn:
-        return ps_arn
 
-    return None
+    if not ps_list:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_DESCRIBE_WORKERS, len(ps_list))
+    ) as executor:
+        ps_names = executor.map(functools.partial(get_ps_name, instance_arn), ps_list)
+        return dict(zip(ps_names, ps_list))
 
 
-# TODO: refactor to a generic form
 def find_first_matching_ps_name(
-    ps_list: list[str], instance_arn: str, ps_name: str
+    ps_name_arns: Mapping[str, str], ps_name: str
 ) -> Optional[str]:
     """
-    Finds the first matching PS name in the given list of PS ARNs.
+    Finds the first matching PS name in a mapping of PS names to ARNs.
+
+    The lookup is done entirely in memory, e.g. on the index built by `_ps_name_index`
+    or on the result of `get_ps_name_arn_for_account`.
 
     Args:
-        ps_list (list[str]): List of PS ARNs to search through.
-        instance_arn (str): Instance ARN.
+        ps_name_arns (Mapping[str, str]): PS names mapped to their ARNs.
         ps_name (str): Partial or full name of the PS to find.
 
     Returns:
-        dict[str, str]: A dictionary containing the full PS name as the key and the corresponding PS ARN as the value.
-        Returns an empty dictionary if no matching PS name is found.
+        Optional[str]: The ARN of the PS whose name equals `ps_name`, or else of the first
+            PS whose name contains it. None if no PS matches.
     """
-    for ps_arn in ps_list:
-        full_ps_name = get_ps_name(instance_arn, ps_arn)
+    ps_arn = ps_name_arns.get(ps_name)
+    if ps_arn:
+        return ps_arn
+
+    for full_ps_name, ps_arn in ps_name_arns.items():
         if ps_name in full_ps_name:
             return ps_arn
+
     return None
 
 
@@ -166,9 +353,17 @@ def get_full_ps_list_for_instance(instance_arn: str) -> list[str]:
     Returns:
         list[str]: A list of permission set names.
     """
-    return AWSClientFactory.get(SSOAdminClient).list_permission_sets(
-        InstanceArn=instance_arn
-    )["PermissionSets"]
+    paginator = AWSClientFactory.get(SSOAdminClient).get_paginator(
+        "list_permission_sets"
+    )
+    return [
+        ps_arn
+        for page in paginator.paginate(
+            InstanceArn=instance_arn,
+            PaginationConfig={"PageSize": SSO_MAX_PAGE_SIZE},
+        )
+        for ps_arn in page.get("PermissionSets", [])
+    ]
 
 
 def get_group_id_by_name(group_name: str, identity_id) -> Optional[str]:
@@ -179,19 +374,26 @@ def get_group_id_by_name(group_name: str, identity_id) -> Optional[str]:
         group_name (str): The name of the group.
 
     Returns:
-        str: The ID of the group.
+        str: The ID of the group, or None if no group has that name.
     """
-    sso_client = AWSClientFactory.get(IdentityStoreClient)
-    group_response = sso_client.list_groups(
-        IdentityStoreId=identity_id,
-        Filters=[{"AttributePath": "DisplayName", "AttributeValue": group_name}],
-    )
-    if group_response["Groups"]:
-        return next(group_response["Groups"])["GroupId"]
-
-    return None
-
-
+    identity_client = AWSClientFactory.get(IdentityStoreClient)
+    # the API takes the display name as a string document; the stubs type every
+    # AttributeValue as a JSON object
+    alternate_identifier: AlternateIdentifierTypeDef = {
+        "UniqueAttribute": {
+            "AttributePath": "DisplayName",
+            "AttributeValue": cast(Mapping[str, Any], group_name),
+        }
+    }
+    try:
+        return identity_client.get_group_id(
+            IdentityStoreId=identity_id, AlternateIdentifier=alternate_identifier
+        )["GroupId"]
+    except identity_client.exceptions.ResourceNotFoundException:
+        return None
+
+
+@ttl_cache(PS_NAME_INDEX_TTL)
 def get_ps_name(instance_arn, ps_arn) -> str:
     """
     Retrieves the name of a permission set.
@@ -202,6 +404,9 @@ def get_ps_name(instance_arn, ps_arn) -> str:
 
     Returns:
         str: The name of the permission set.
+
+    Names are cached for `PS_NAME_INDEX_TTL` seconds, like the name index, so a warm
+    process picks up renamed permission sets and drops deleted ones.
     """
     sso_client = AWSClientFactory.get(SSOAdminClient)
     ps_name = sso_client.describe_permission_set(
@@ -211,13 +416,9 @@ def get_ps_name(instance_arn, ps_arn) -> str:
     return ps_name
 
 
-def provision_ps_for_account(self):
-    pass
-
-
 def get_ps_principal_details(
     account_id: str, instance_arn: str, ps_arn: str
-) -> PrincipalDetails:
+) -> Optional[PrincipalDetails]:
     """
     Retrieves the principal details for a given account, instance, and permission set.
 
@@ -227,12 +428,18 @@ def get_ps_principal_details(
         ps_arn (str): The ARN of the permission set.
 
     Returns:
-        PrincipalDetails: An object containing the principal type and ID.
-
+        Optional[PrincipalDetails]: An object containing the principal type and ID, or None
+            if the permission set has no assignment in the account.
     """
-    sso_admin_client = AWSClientFactory.get(SSOAdminClient)
-    sso_response = sso_admin_client.list_account_assignments(
-        account_id, instance_arn, ps_arn
+    paginator = AWSClientFactory.get(SSOAdminClient).get_paginator(
+        "list_account_assignments"
     )
-    account_assignment = next(sso_response["AccountAssignments"])
-    return PrincipalDetails(account_assignment["PrincipalType"], account_assignment["PrincipalId"])
+    for page in paginator.paginate(
+        InstanceArn=instance_arn, AccountId=account_id, PermissionSetArn=ps_arn
+    ):
+        for account_assignment in page.get("AccountAssignments", []):
+            return PrincipalDetails(
+                account_assignment["PrincipalType"], account_assignment["PrincipalId"]
+            )
+
+    return None
@@ -1,21 +1,43 @@
-from random import randint
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-print("Hello World!")
+from core.authentication.aws_client_factory import MaxPoolConnections
+from core.logging_config import configure_logging
+from core.utils import logger
+from core.utils import sso_admin_utils
 
-from core import utils
+# each account fans out to MAX_DESCRIBE_WORKERS threads of its own, so this keeps the
+# total number of requests in flight within the factory's connection pool
+MAX_ACCOUNT_WORKERS = MaxPoolConnections // sso_admin_utils.MAX_DESCRIBE_WORKERS
 
 
 def main():
-    it_list = iter([1, 2, 3, 4])
-    a = next(it_list)
-    print(a)
-    b = next(it_list)
-    print(b)
-   
+    configure_logging()
+    account_ids = [
+        account_id.strip()
+        for account_id in os.getenv("account_ids", "").split(",")
+        if account_id.strip()
+    ]
+    if not account_ids:
+        logger.info("No account_ids configured")
+        return
+
+    instances = sso_admin_utils.get_iam_sso_instance_data()
+    with ThreadPoolExecutor(max_workers=MAX_ACCOUNT_WORKERS) as executor:
+        results = executor.map(
+            functools.partial(
+                sso_admin_utils.get_ps_details_for_account, instances=instances
+            ),
+            account_ids,
+        )
+        for account_id, ps_details in zip(account_ids, results):
+            logger.info("Permission sets for %s: %s", account_id, list(ps_details))
+
 
 if __name__ == "__main__":
     main()
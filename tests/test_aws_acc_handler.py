@@ -0,0 +1,134 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from core.handlers.aws_acc_handler import AWS
+from core.schemas.ps_requests import PSConfigPayload
+from core.utils import sso_admin_utils
+
+ACCOUNT_ID = "123456789012"
+INSTANCE_ARN = "arn:aws:sso:::instance/ssoins-1"
+
+
+def ps_payload(ps_name, instance_arn=INSTANCE_ARN):
+    return PSConfigPayload(
+        InstanceArn=instance_arn,
+        TargetId=ACCOUNT_ID,
+        PermissionSetArn=f"arn:aws:sso:::permissionSet/ssoins-1/{ps_name}",
+        PrincipalId=f"group-{ps_name}",
+    )
+
+
+@pytest.fixture
+def sso_client():
+    client = mock.Mock()
+    client.delete_account_assignment.side_effect = lambda **payload: {
+        "AccountAssignmentDeletionStatus": {
+            "Status": "IN_PROGRESS",
+            "RequestId": payload["PermissionSetArn"],
+        }
+    }
+    client.describe_account_assignment_deletion_status.return_value = {
+        "AccountAssignmentDeletionStatus": {"Status": "SUCCEEDED"}
+    }
+    client.create_account_assignment.side_effect = lambda **payload: {
+        "AccountAssignmentCreationStatus": {
+            "Status": "IN_PROGRESS",
+            "RequestId": payload["InstanceArn"],
+        }
+    }
+    client.describe_account_assignment_creation_status.return_value = {
+        "AccountAssignmentCreationStatus": {"Status": "SUCCEEDED"}
+    }
+    return client
+
+
+@pytest.fixture
+def ps_list_payload():
+    payload = {ps_name: ps_payload(ps_name) for ps_name in ("Admin", "ReadOnly")}
+    with mock.patch.object(
+        sso_admin_utils,
+        "aget_ps_details_for_account",
+        new_callable=mock.AsyncMock,
+        return_value=payload,
+    ):
+        yield payload
+
+
+def test_remove_account_from_ps_deletes_every_assignment(sso_client, ps_list_payload):
+    aws = AWS(mock.Mock(**{"get.return_value": sso_client}))
+
+    result = asyncio.run(aws.remove_account_from_ps(ACCOUNT_ID))
+
+    assert result == ps_list_payload
+    assert sso_client.delete_account_assignment.call_count == 2
+    sso_client.describe_account_assignment_deletion_status.assert_any_call(
+        InstanceArn=INSTANCE_ARN,
+        AccountAssignmentDeletionRequestId=ps_list_payload["Admin"].PermissionSetArn,
+    )
+
+
+def test_remove_account_from_ps_finishes_siblings_before_raising(
+    sso_client, ps_list_payload
+):
+    failure = RuntimeError("access denied")
+    deletions = sso_client.delete_account_assignment.side_effect
+
+    def delete_account_assignment(**payload):
+        if payload["PermissionSetArn"] == ps_list_payload["Admin"].PermissionSetArn:
+            raise failure
+        return deletions(**payload)
+
+    sso_client.delete_account_assignment.side_effect = delete_account_assignment
+    aws = AWS(mock.Mock(**{"get.return_value": sso_client}))
+
+    with pytest.raises(RuntimeError) as excinfo:
+        asyncio.run(aws.remove_account_from_ps(ACCOUNT_ID))
+
+    assert excinfo.value is failure
+    sso_client.describe_account_assignment_deletion_status.assert_called_once_with(
+        InstanceArn=INSTANCE_ARN,
+        AccountAssignmentDeletionRequestId=ps_list_payload["ReadOnly"].PermissionSetArn,
+    )
+
+
+def test_add_account_to_ps_finishes_other_instances_before_raising(sso_client):
+    other_instance_arn = "arn:aws:sso:::instance/ssoins-2"
+    ps_data = [ps_payload("Admin"), ps_payload("Admin", other_instance_arn)]
+    failure = RuntimeError("conflict")
+    creations = sso_client.create_account_assignment.side_effect
+
+    def create_account_assignment(**payload):
+        if payload["InstanceArn"] == INSTANCE_ARN:
+            raise failure
+        return creations(**payload)
+
+    sso_client.create_account_assignment.side_effect = create_account_assignment
+    aws = AWS(mock.Mock(**{"get.return_value": sso_client}))
+
+    with mock.patch.object(
+        sso_admin_utils, "get_ps_details_for_name", return_value=ps_data
+    ):
+        with pytest.raises(RuntimeError) as excinfo:
+            asyncio.run(aws.add_account_to_ps(ACCOUNT_ID, "Admin", "Admins"))
+
+    assert excinfo.value is failure
+    sso_client.describe_account_assignment_creation_status.assert_called_once_with(
+        InstanceArn=other_instance_arn,
+        AccountAssignmentCreationRequestId=other_instance_arn,
+    )
+
+
+def test_remove_account_from_ps_without_permission_sets_returns_empty(sso_client):
+    aws = AWS(mock.Mock(**{"get.return_value": sso_client}))
+
+    with mock.patch.object(
+        sso_admin_utils,
+        "aget_ps_details_for_account",
+        new_callable=mock.AsyncMock,
+        return_value={},
+    ):
+        assert asyncio.run(aws.remove_account_from_ps(ACCOUNT_ID)) == {}
+
+    sso_client.delete_account_assignment.assert_not_called()
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+from mypy_boto3_servicecatalog import ServiceCatalogClient
+from mypy_boto3_sts import STSClient
+
+from core.authentication.aws_client_factory import (
+    AWSClientFactory,
+    ClientConfig,
+    CredentialsExpiryWindow,
+)
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/Admin"
+REGION = "us-east-1"
+
+# private classmethods of the factory, looked up by their mangled names
+get_sts_credentials = getattr(
+    AWSClientFactory, "_AWSClientFactory__get_sts_credentials"
+)
+get_session = getattr(AWSClientFactory, "_AWSClientFactory__get_session")
+
+
+def assume_role_response(access_key_id, expires_in):
+    return {
+        "Credentials": {
+            "AccessKeyId": access_key_id,
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.now(timezone.utc) + expires_in,
+        }
+    }
+
+
+@pytest.fixture
+def client_cache():
+    yield AWSClientFactory.clients
+    AWSClientFactory.clients.clear()
+    AWSClientFactory.sessions.clear()
+
+
+@pytest.fixture
+def sts_client():
+    sts_client = mock.Mock()
+    with mock.patch.object(AWSClientFactory, "get", return_value=sts_client):
+        yield sts_client
+    AWSClientFactory.sessions.clear()
+    AWSClientFactory.sts_credentials.clear()
+
+
+def test_sts_credentials_are_reused_until_the_expiry_window(sts_client):
+    sts_client.assume_role.return_value = assume_role_response(
+        "first", timedelta(hours=1)
+    )
+
+    first = get_sts_credentials(ROLE_ARN)
+
+    assert get_sts_credentials(ROLE_ARN) is first
+    sts_client.assume_role.assert_called_once()
+
+
+def test_sts_credentials_are_refreshed_inside_the_expiry_window(sts_client):
+    sts_client.assume_role.side_effect = [
+        assume_role_response("first", CredentialsExpiryWindow - timedelta(seconds=1)),
+        assume_role_response("second", timedelta(hours=1)),
+    ]
+
+    get_sts_credentials(ROLE_ARN)
+
+    assert get_sts_credentials(ROLE_ARN)["AccessKeyId"] == "second"
+    assert sts_client.assume_role.call_count == 2
+
+
+def test_force_refresh_assumes_the_role_again(sts_client):
+    sts_client.assume_role.side_effect = [
+        assume_role_response("first", timedelta(hours=1)),
+        assume_role_response("second", timedelta(hours=1)),
+    ]
+
+    get_sts_credentials(ROLE_ARN)
+
+    assert get_sts_credentials(ROLE_ARN, force_refresh=True)["AccessKeyId"] == "second"
+
+
+def test_role_sessions_resolve_the_assumed_role_credentials(sts_client):
+    sts_client.assume_role.return_value = assume_role_response(
+        "assumed", timedelta(hours=1)
+    )
+
+    credentials = get_session(REGION, ROLE_ARN).get_credentials()
+
+    assert credentials.access_key == "assumed"
+    assert credentials.method == "sts-assume-role"
+
+
+def test_clients_are_cached_per_type_region_and_role(client_cache):
+    client = AWSClientFactory.get(ServiceCatalogClient, REGION)
+    other_region = AWSClientFactory.get(ServiceCatalogClient, "eu-west-1")
+
+    assert AWSClientFactory.get(ServiceCatalogClient, REGION) is client
+    assert other_region is not client
+    assert other_region.meta.region_name == "eu-west-1"
+    assert AWSClientFactory.get(STSClient, REGION) is not client
+    assert len(client_cache) == 3
+
+
+def test_clients_share_the_pool_and_retry_config(client_cache):
+    config = AWSClientFactory.get(ServiceCatalogClient, REGION).meta.config
+
+    assert config.max_pool_connections == ClientConfig.max_pool_connections
+    assert config.retries["mode"] == "adaptive"
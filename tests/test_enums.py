@@ -0,0 +1,22 @@
+import pytest
+
+from core.commons.enums import OperationStatus
+
+
+@pytest.mark.parametrize(
+    "record_status, expected",
+    [
+        ("SUCCEEDED", OperationStatus.SUCCEEDED),
+        ("FAILED", OperationStatus.FAILED),
+        ("IN_PROGRESS", OperationStatus.IN_PROGRESS),
+        ("IN_PROGRESS_IN_ERROR", OperationStatus.IN_PROGRESS),
+        ("CREATED", OperationStatus.WAITING),
+    ],
+)
+def test_from_str_maps_record_statuses(record_status, expected):
+    assert OperationStatus.from_str(record_status) is expected
+
+
+@pytest.mark.parametrize("record_status", ["SUCCES", "succeeded", ""])
+def test_from_str_falls_back_to_failed(record_status):
+    assert OperationStatus.from_str(record_status) is OperationStatus.FAILED
@@ -0,0 +1,93 @@
+import asyncio
+import os
+from unittest import mock
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from core.authentication.aws_client_factory import AWSClientFactory
+from core.handlers.aws_acc_handler import AWS
+from core.utils import sc_utils
+
+ACCOUNT_ID = "123456789012"
+
+
+def search_params(page_token=None):
+    params = {
+        "AccessLevelFilter": {"Key": "Account", "Value": "self"},
+        "Filters": {"SearchQuery": [ACCOUNT_ID]},
+        "PageSize": sc_utils.SC_MAX_PAGE_SIZE,
+    }
+    if page_token is not None:
+        params["PageToken"] = page_token
+    return params
+
+
+@pytest.fixture
+def sc_client():
+    client = boto3.client("servicecatalog", region_name=os.environ["AWS_REGION"])
+    with Stubber(client) as stubber:
+        client.stubber = stubber
+        yield client
+        stubber.assert_no_pending_responses()
+
+
+class StubClientFactory:
+    def __init__(self, sc_client):
+        self.clients = {
+            "ServiceCatalogClient": sc_client,
+            "SSOAdminClient": boto3.client(
+                "sso-admin", region_name=os.environ["AWS_REGION"]
+            ),
+        }
+
+    def get(self, client_class, region=None, role_arn=None):
+        return self.clients[client_class.__name__]
+
+
+def test_get_sc_products_for_account_follows_page_tokens(sc_client):
+    sc_client.stubber.add_response(
+        "search_provisioned_products",
+        {
+            "ProvisionedProducts": [
+                {"Id": "pp-available", "Status": "AVAILABLE"},
+                {"Id": "pp-error", "Status": "ERROR"},
+            ],
+            "NextPageToken": "page-2",
+        },
+        search_params(),
+    )
+    sc_client.stubber.add_response(
+        "search_provisioned_products",
+        {"ProvisionedProducts": [{"Id": "pp-last", "Status": "AVAILABLE"}]},
+        search_params("page-2"),
+    )
+
+    with mock.patch.object(AWSClientFactory, "get", return_value=sc_client):
+        product_ids = sc_utils.get_sc_products_for_account(ACCOUNT_ID)
+
+    assert product_ids == ["pp-available", "pp-last"]
+
+
+def test_terminate_control_tower_account_terminates_the_account_products(sc_client):
+    sc_client.stubber.add_response(
+        "search_provisioned_products",
+        {"ProvisionedProducts": [{"Id": "pp-available", "Status": "AVAILABLE"}]},
+        search_params(),
+    )
+    sc_client.stubber.add_response(
+        "terminate_provisioned_product",
+        {"RecordDetail": {"RecordId": "rec-1", "Status": "CREATED"}},
+        {"ProvisionedProductId": "pp-available", "IgnoreErrors": True},
+    )
+    sc_client.stubber.add_response(
+        "describe_record",
+        {"RecordDetail": {"RecordId": "rec-1", "Status": "SUCCEEDED"}},
+        {"Id": "rec-1"},
+    )
+
+    handler = AWS(StubClientFactory(sc_client))
+    message = asyncio.run(handler.terminate_control_tower_account(ACCOUNT_ID))
+
+    assert "pp-available" in message
@@ -0,0 +1,161 @@
+import asyncio
+import os
+from unittest import mock
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+import core.utils as utils
+from core.authentication.aws_client_factory import AWSClientFactory
+from core.utils import sso_admin_utils
+
+ACCOUNT_ID = "123456789012"
+IDENTITY_STORE_ID = "d-1234567890"
+INSTANCE = sso_admin_utils.IAMSSOInstance(
+    IDENTITY_STORE_ID, "arn:aws:sso:::instance/ssoins-1"
+)
+PS_NAMES = {
+    "arn:aws:sso:::permissionSet/ssoins-1/ps-readonly": "ReadOnlyAdmin",
+    "arn:aws:sso:::permissionSet/ssoins-1/ps-admin": "Admin",
+}
+# the autouse fixture below replaces get_ps_name, so its tests use the real one
+get_ps_name = sso_admin_utils.get_ps_name
+
+
+@pytest.fixture(autouse=True)
+def sso_instance():
+    sso_admin_utils._ps_name_index.cache_clear()
+    with (
+        mock.patch.object(
+            sso_admin_utils, "get_iam_sso_instance_data", return_value=[INSTANCE]
+        ),
+        mock.patch.object(
+            sso_admin_utils,
+            "get_ps_name",
+            side_effect=lambda _, ps_arn: PS_NAMES[ps_arn],
+        ),
+    ):
+        yield
+    sso_admin_utils._ps_name_index.cache_clear()
+
+
+@pytest.fixture
+def identity_client():
+    client = boto3.client("identitystore", region_name=os.environ["AWS_REGION"])
+    with (
+        Stubber(client) as stubber,
+        mock.patch.object(AWSClientFactory, "get", return_value=client),
+    ):
+        client.stubber = stubber
+        yield client
+        stubber.assert_no_pending_responses()
+
+
+def group_id_params(group_name):
+    return {
+        "IdentityStoreId": IDENTITY_STORE_ID,
+        "AlternateIdentifier": {
+            "UniqueAttribute": {
+                "AttributePath": "DisplayName",
+                "AttributeValue": group_name,
+            }
+        },
+    }
+
+
+def test_get_group_id_by_name_looks_up_the_display_name(identity_client):
+    identity_client.stubber.add_response(
+        "get_group_id",
+        {
+            "GroupId": "group-1",
+            "GroupArn": f"arn:aws:identitystore::{ACCOUNT_ID}:group/{IDENTITY_STORE_ID}/group-1",
+            "IdentityStoreId": IDENTITY_STORE_ID,
+        },
+        group_id_params("Admins"),
+    )
+
+    assert (
+        sso_admin_utils.get_group_id_by_name("Admins", IDENTITY_STORE_ID) == "group-1"
+    )
+
+
+def test_get_group_id_by_name_returns_none_for_unknown_groups(identity_client):
+    identity_client.stubber.add_client_error(
+        "get_group_id",
+        service_error_code="ResourceNotFoundException",
+        expected_params=group_id_params("Nobody"),
+    )
+
+    assert sso_admin_utils.get_group_id_by_name("Nobody", IDENTITY_STORE_ID) is None
+
+
+def test_get_ps_details_for_name_prefers_an_exact_name_match():
+    with (
+        mock.patch.object(
+            sso_admin_utils,
+            "get_full_ps_list_for_instance",
+            return_value=list(PS_NAMES),
+        ),
+        mock.patch.object(
+            sso_admin_utils, "get_ps_list_for_account", return_value=list(PS_NAMES)[:1]
+        ),
+        mock.patch.object(
+            sso_admin_utils, "get_group_id_by_name", return_value="group-1"
+        ),
+    ):
+        ps_data = sso_admin_utils.get_ps_details_for_name(ACCOUNT_ID, "Admin", "Admins")
+
+    assert [payload.PermissionSetArn for payload in ps_data] == [
+        "arn:aws:sso:::permissionSet/ssoins-1/ps-admin"
+    ]
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_get_ps_details_for_account_skips_sets_without_assignments(asynchronous):
+    principals = {
+        "arn:aws:sso:::permissionSet/ssoins-1/ps-admin": (
+            sso_admin_utils.PrincipalDetails("GROUP", "group-1")
+        )
+    }
+    with (
+        mock.patch.object(
+            sso_admin_utils, "get_ps_list_for_account", return_value=list(PS_NAMES)
+        ),
+        mock.patch.object(
+            sso_admin_utils,
+            "get_ps_principal_details",
+            side_effect=lambda _, __, ps_arn: principals.get(ps_arn),
+        ),
+    ):
+        if asynchronous:
+            ps_data = asyncio.run(
+                sso_admin_utils.aget_ps_details_for_account(ACCOUNT_ID)
+            )
+        else:
+            ps_data = sso_admin_utils.get_ps_details_for_account(ACCOUNT_ID)
+
+    assert list(ps_data) == ["Admin"]
+    assert ps_data["Admin"].PrincipalId == "group-1"
+
+
+def test_get_ps_name_caches_names_until_the_index_ttl():
+    ps_arn = next(iter(PS_NAMES))
+    sso_client = mock.Mock()
+    sso_client.describe_permission_set.side_effect = [
+        {"PermissionSet": {"Name": "ReadOnly"}},
+        {"PermissionSet": {"Name": "ReadOnlyAdmin"}},
+    ]
+    get_ps_name.cache_clear()
+    with (
+        mock.patch.object(AWSClientFactory, "get", return_value=sso_client),
+        mock.patch.object(utils.time, "monotonic", return_value=100.0) as monotonic,
+    ):
+        assert get_ps_name(INSTANCE.instance_arn, ps_arn) == "ReadOnly"
+        assert get_ps_name(INSTANCE.instance_arn, ps_arn) == "ReadOnly"
+
+        monotonic.return_value += sso_admin_utils.PS_NAME_INDEX_TTL + 1
+        assert get_ps_name(INSTANCE.instance_arn, ps_arn) == "ReadOnlyAdmin"
+
+    assert sso_client.describe_permission_set.call_count == 2
+    get_ps_name.cache_clear()
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+import core.utils as utils
+
+
+@pytest.fixture
+def monotonic():
+    with mock.patch.object(utils.time, "monotonic", return_value=100.0) as monotonic:
+        yield monotonic
+
+
+@pytest.fixture
+def lookup():
+    @utils.ttl_cache(10)
+    def lookup(key):
+        lookup.calls.append(key)
+        if key == "missing":
+            raise ValueError(key)
+        return f"{key}-{len(lookup.calls)}"
+
+    lookup.calls = []
+    return lookup
+
+
+def test_ttl_cache_reuses_results_until_they_expire(monotonic, lookup):
+    assert lookup("a") == "a-1"
+    monotonic.return_value = 109.0
+    assert lookup("a") == "a-1"
+    monotonic.return_value = 111.0
+    assert lookup("a") == "a-2"
+
+
+def test_ttl_cache_keys_results_on_the_arguments(monotonic, lookup):
+    assert lookup("a") == "a-1"
+    assert lookup("b") == "b-2"
+    assert lookup.calls == ["a", "b"]
+
+
+def test_ttl_cache_clear_drops_cached_results(monotonic, lookup):
+    lookup("a")
+    lookup.cache_clear()
+
+    assert lookup("a") == "a-2"
+
+
+def test_ttl_cache_does_not_cache_exceptions(monotonic, lookup):
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            lookup("missing")
+
+    assert lookup.calls == ["missing", "missing"]
+
+
+def is_pending(response):
+    return response["Status"] == "IN_PROGRESS"
+
+
+def test_block_until_complete_returns_the_first_finished_response():
+    task = mock.Mock(side_effect=[{"Status": "IN_PROGRESS"}, {"Status": "SUCCEEDED"}])
+
+    response = asyncio.run(
+        utils.block_until_complete(task, [], {"Id": "rec-1"}, is_pending, base_delay=0)
+    )
+
+    assert response == {"Status": "SUCCEEDED"}
+    task.assert_called_with(Id="rec-1")
+
+
+def test_block_until_complete_stops_after_max_attempts():
+    task = mock.Mock(return_value={"Status": "IN_PROGRESS"})
+
+    with pytest.raises(TimeoutError, match="after 3 attempts"):
+        asyncio.run(
+            utils.block_until_complete(
+                task, [], {}, is_pending, base_delay=0, max_attempts=3
+            )
+        )
+
+    assert task.call_count == 3
+
+
+def test_block_until_complete_never_sleeps_past_the_deadline():
+    task = mock.Mock(return_value={"Status": "IN_PROGRESS"})
+
+    with (
+        mock.patch.object(utils.random, "uniform", side_effect=lambda low, high: high),
+        mock.patch.object(utils.asyncio, "sleep", new_callable=mock.AsyncMock) as sleep,
+        pytest.raises(TimeoutError, match="after 2 attempts"),
+    ):
+        asyncio.run(
+            utils.block_until_complete(
+                task,
+                [],
+                {},
+                is_pending,
+                base_delay=30,
+                max_delay=30,
+                max_attempts=2,
+                timeout=5,
+            )
+        )
+
+    # the 30s backoff is clamped to the time left before the 5s deadline
+    (delay,), _ = sleep.await_args
+    assert 0 < delay <= 5
+
+
+def test_make_status_waiter_polls_the_status_object_until_it_is_not_pending():
+    describe = mock.Mock(
+        side_effect=[
+            {"RecordDetail": {"Status": "CREATED"}},
+            {"RecordDetail": {"Status": "IN_PROGRESS"}},
+            {"RecordDetail": {"Status": "SUCCEEDED"}},
+        ]
+    )
+    wait = utils.make_status_waiter(
+        describe, "RecordDetail", frozenset({"CREATED", "IN_PROGRESS"}), base_delay=0
+    )
+
+    response = asyncio.run(wait(Id="rec-1"))
+
+    assert response == {"RecordDetail": {"Status": "SUCCEEDED"}}
+    assert describe.call_count == 3
+    describe.assert_called_with(Id="rec-1")
+
+
+def test_run_blocking_runs_the_call_off_the_event_loop():
+    async def thread_ids():
+        return await utils.run_blocking(threading.get_ident), threading.get_ident()
+
+    worker_thread, loop_thread = asyncio.run(thread_ids())
+
+    assert worker_thread != loop_thread